@@ -11,25 +11,52 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import gzip
 import httpx
 
 from typing import Optional, Dict, List
 
+from .scaleway_models import dumps_json_bytes
+
 _ENDPOINT_PLATFORM = "/platforms"
 _ENDPOINT_SESSION = "/sessions"
 _ENDPOINT_JOB = "/jobs"
 
+_COMPRESSION_THRESHOLD = 4 * 1024
+
 
 class QaaSClient:
-    def __init__(self, project_id: str, token: str, url: str) -> None:
+    def __init__(
+        self, project_id: str, token: str, url: str, compress_requests: bool = False
+    ) -> None:
         self.__token = token
         self.__url = url
         self.__project_id = project_id
+        self.__http_client = None
+        # Opt-in only: a server ignoring Content-Encoding would reject gzip bodies
+        self.__compress_requests = compress_requests
+
+    def __getstate__(self) -> Dict:
+        # The httpx client holds locks and sockets: drop it, it is rebuilt on demand
+        state = self.__dict__.copy()
+        state["_QaaSClient__http_client"] = None
+
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
 
     def _http_client(self) -> httpx.Client:
-        return httpx.Client(
-            headers=self._api_headers(), base_url=self.__url, timeout=10.0, verify=True
-        )
+        # Reused across calls to benefit from connection keep-alive
+        if self.__http_client is None:
+            self.__http_client = httpx.Client(
+                headers=self._api_headers(),
+                base_url=self.__url,
+                timeout=10.0,
+                verify=True,
+            )
+
+        return self.__http_client
 
     def _api_headers(self) -> Dict:
         return {"X-Auth-Token": self.__token}
@@ -37,6 +64,29 @@ class QaaSClient:
     def _build_endpoint(self, endpoint: str) -> str:
         return f"{self.__url}{endpoint}"
 
+    def _post_json(self, endpoint: str, payload: Dict) -> httpx.Response:
+        http_client = self._http_client()
+        content = dumps_json_bytes(payload)
+        headers = {"Content-Type": "application/json"}
+
+        if not self.__compress_requests or len(content) < _COMPRESSION_THRESHOLD:
+            return http_client.post(endpoint, content=content, headers=headers)
+
+        response = http_client.post(
+            endpoint,
+            content=gzip.compress(content, compresslevel=6),
+            headers={**headers, "Content-Encoding": "gzip"},
+        )
+
+        if response.status_code != httpx.codes.UNSUPPORTED_MEDIA_TYPE:
+            return response
+
+        # The server does not accept compressed bodies: stop compressing for
+        # this client and retry as identity
+        self.__compress_requests = False
+
+        return http_client.post(endpoint, content=content, headers=headers)
+
     def get_platform(self, platform_id: str) -> Dict:
         http_client = self._http_client()
         endpoint = f"{self._build_endpoint(_ENDPOINT_PLATFORM)}/{platform_id}"
@@ -46,15 +96,20 @@ class QaaSClient:
 
         return resp.json()
 
-    def list_platforms(self, name: Optional[str] = None) -> Dict:
-        filter_by_name = ""
+    def list_platforms(
+        self, name: Optional[str] = None, backend_name: Optional[str] = None
+    ) -> Dict:
+        params = {}
         if name:
-            filter_by_name = f"?name={name}"
+            params["name"] = name
+
+        if backend_name:
+            params["backend_name"] = backend_name
 
         http_client = self._http_client()
-        endpoint = f"{self._build_endpoint(_ENDPOINT_PLATFORM)}{filter_by_name}"
+        endpoint = self._build_endpoint(_ENDPOINT_PLATFORM)
 
-        resp = http_client.get(endpoint)
+        resp = http_client.get(endpoint, params=params)
         resp.raise_for_status()
 
         return resp.json()
@@ -137,15 +192,13 @@ class QaaSClient:
         http_client.delete(self._build_endpoint(f"{_ENDPOINT_SESSION}/{session_id}"))
 
     def create_job(self, name: str, session_id: str, circuits: Dict) -> str:
-        http_client = self._http_client()
-
         payload = {
             "name": name,
             "session_id": session_id,
             "circuit": {"qiskit_circuit": f"{circuits}"},
         }
 
-        response = http_client.post(self._build_endpoint(_ENDPOINT_JOB), json=payload)
+        response = self._post_json(self._build_endpoint(_ENDPOINT_JOB), payload)
 
         response.raise_for_status()
         response_dict = response.json()
@@ -11,15 +11,31 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import time
 import cirq
 
-from typing import Union, Optional
+from typing import Dict, Union, Optional
 
 from .scaleway_session import ScalewaySession
 from .scaleway_client import QaaSClient
 
+_AVAILABILITY_TTL = 5
+
 
 class ScalewayDevice(cirq.devices.Device):
+    # cirq.devices.Device has no __slots__, so instances keep a __dict__,
+    # but private fields live in slots
+    __slots__ = (
+        "_ScalewayDevice__id",
+        "_ScalewayDevice__client",
+        "_ScalewayDevice__version",
+        "_ScalewayDevice__num_qubits",
+        "_ScalewayDevice__name",
+        "_ScalewayDevice__metadata",
+        "_ScalewayDevice__availability",
+        "_ScalewayDevice__availability_ts",
+    )
+
     def __init__(
         self,
         client: QaaSClient,
@@ -28,6 +44,7 @@ class ScalewayDevice(cirq.devices.Device):
         version: str,
         num_qubits: int,
         metadata: Optional[str],
+        availability: Optional[str] = None,
     ) -> None:
         self.__id = id
         self.__client = client
@@ -35,6 +52,60 @@ class ScalewayDevice(cirq.devices.Device):
         self.__num_qubits = num_qubits
         self.__name = name
         self.__metadata = metadata
+        self.__availability = None
+        self.__availability_ts = None
+
+        if availability is not None:
+            self._set_availability(availability)
+
+    @classmethod
+    def _from_platform(cls, client: QaaSClient, platform: Dict) -> "ScalewayDevice":
+        """Builds a device from a platform description returned by the API."""
+        return cls(
+            client=client,
+            id=platform.get("id"),
+            name=platform.get("name"),
+            version=platform.get("version"),
+            num_qubits=platform.get("max_qubit_count"),
+            metadata=platform.get("metadata", None),
+            availability=platform.get("availability", None),
+        )
+
+    def _refresh(self) -> "ScalewayDevice":
+        """Re-pulls the platform description from the API.
+
+        Name, version and qubit count are snapshotted at construction and never
+        fetched again unless this method is explicitly called (e.g. after a
+        platform recalibration).
+
+        Returns:
+            ScalewayDevice: the refreshed device.
+        """
+        resp = self.__client.get_platform(self.__id)
+
+        self.__name = resp.get("name", self.__name)
+        self.__version = resp.get("version", self.__version)
+        self.__num_qubits = resp.get("max_qubit_count", self.__num_qubits)
+        self.__metadata = resp.get("metadata", self.__metadata)
+
+        self._set_availability(resp.get("availability"))
+
+        return self
+
+    def _set_availability(self, availability: Optional[str]) -> None:
+        self.__availability = availability
+        self.__availability_ts = time.monotonic()
+
+    def refresh_availability(self) -> str:
+        """Forces a fetch of the current status of the platform, bypassing the cache.
+
+        Returns:
+            str: the current availability status of the platform.
+        """
+        resp = self.__client.get_platform(self.__id)
+        self._set_availability(resp.get("availability"))
+
+        return self.__availability
 
     def __repr__(self) -> str:
         return f"<ScalewayDevice(name={self.__name},num_qubits={self.__num_qubits},platform_id={self.id})>"
@@ -51,13 +122,19 @@ class ScalewayDevice(cirq.devices.Device):
     @property
     def availability(self) -> str:
         """Returns the current status of the platform.
+        This is the only property querying the API, all others are static.
+        The value is cached for a few seconds to coalesce rapid polls.
 
         Returns:
             str: the current availability statys of the session. Can be either: available, shortage or scarce
         """
-        resp = self.__client.get_platform(self.__id)
+        if (
+            self.__availability_ts is not None
+            and time.monotonic() - self.__availability_ts < _AVAILABILITY_TTL
+        ):
+            return self.__availability
 
-        return resp.get("availability")
+        return self.refresh_availability()
 
     @property
     def name(self) -> str:
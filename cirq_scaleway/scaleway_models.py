@@ -11,12 +11,43 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import json
+
 from enum import Enum
-from typing import List, Dict
+from typing import Any, List, Dict, Union
 
 from dataclasses import dataclass
 from dataclasses_json import dataclass_json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(obj: Any) -> str:
+    """Serializes a JSON-compatible object, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+
+    return json.dumps(obj)
+
+
+def dumps_json_bytes(obj: Any) -> bytes:
+    """Serializes a JSON-compatible object to UTF-8 bytes, ready to be sent as a request body."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+
+    return json.dumps(obj).encode()
+
+
+def loads_json(data: Union[str, bytes]) -> Any:
+    """Deserializes a JSON document, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
 
 class SerializationType(Enum):
     UNKOWN = 0
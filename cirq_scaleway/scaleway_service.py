@@ -21,6 +21,7 @@ from .scaleway_client import QaaSClient
 
 
 _ENDPOINT_URL = "https://api.scaleway.com/qaas/v1alpha1"
+_BACKEND_NAME = "qsim"
 
 
 class ScalewayQuantumService:
@@ -29,6 +30,7 @@ class ScalewayQuantumService:
         project_id: Optional[str] = None,
         secret_key: Optional[str] = None,
         url: Optional[str] = None,
+        compress_requests: bool = False,
     ):
         """Create a new object to interact with the Scaleway quantum service.
 
@@ -36,6 +38,7 @@ class ScalewayQuantumService:
             project_id (str): optional UUID of the Scaleway Project, if the provided ``project_id`` is None, the value is loaded from the SCALEWAY_PROJECT_ID variables in the dotenv file or the CIRQ_SCALEWAY_PROJECT_ID environment variables.
             secret_key (str): optional authentication token required to access the Scaleway API, if the provided ``secret_key`` is None, the value is loaded from the SCALEWAY_API_TOKEN variables in the dotenv file or the CIRQ_SCALEWAY_API_TOKEN environment variables.
             url (str): optional value, endpoint URL of the API, if the provided ``url`` is None, the value is loaded from the SCALEWAY_API_URL variables in the dotenv file or the CIRQ_SCALEWAY_API_URL environment variables, if no url is found, then ``_ENDPOINT_URL`` is used
+            compress_requests (bool): optional, gzip large job submissions. Only enable it if the API endpoint accepts gzip-encoded request bodies.
         Returns:
             ScalewayDevice: The device that match the given name. None if no match.
         """
@@ -59,7 +62,24 @@ class ScalewayQuantumService:
 
         api_url = url or env_api_url or _ENDPOINT_URL
 
-        self.__client = QaaSClient(url=api_url, token=token, project_id=project_id)
+        self.__url = api_url
+        self.__token = token
+        self.__project_id = project_id
+        self.__compress_requests = compress_requests
+        self.__client = None
+
+    @property
+    def _client(self) -> QaaSClient:
+        # Built on first use so creating the service stays cheap
+        if self.__client is None:
+            self.__client = QaaSClient(
+                url=self.__url,
+                token=self.__token,
+                project_id=self.__project_id,
+                compress_requests=self.__compress_requests,
+            )
+
+        return self.__client
 
     def device(self, name: str) -> ScalewayDevice:
         """Returns a device matching the specified name.
@@ -97,22 +117,12 @@ class ScalewayQuantumService:
         if kwargs.get("min_num_qubits") is not None:
             filters["min_num_qubits"] = kwargs.pop("min_num_qubits", None)
 
-        json_resp = self.__client.list_platforms(name)
+        json_resp = self._client.list_platforms(name, backend_name=_BACKEND_NAME)
 
         for platform_dict in json_resp["platforms"]:
-            backend_name = platform_dict.get("backend_name")
-
-            if backend_name == "qsim":
-                scaleway_platforms.append(
-                    ScalewayDevice(
-                        client=self.__client,
-                        id=platform_dict.get("id"),
-                        name=platform_dict.get("name"),
-                        version=platform_dict.get("version"),
-                        num_qubits=platform_dict.get("max_qubit_count"),
-                        metadata=platform_dict.get("metadata", None),
-                    )
-                )
+            scaleway_platforms.append(
+                ScalewayDevice._from_platform(self._client, platform_dict)
+            )
 
         if filters is not None:
             scaleway_platforms = self._filters(scaleway_platforms, filters)
@@ -125,12 +135,13 @@ class ScalewayQuantumService:
         operational = filters.get("operational")
         min_num_qubits = filters.get("min_num_qubits")
 
+        # Filter on static fields first, availability may require an API call
+        if min_num_qubits is not None:
+            backends = [b for b in backends if b.num_qubits >= min_num_qubits]
+
         if operational is not None:
             backends = [
                 b for b in backends if b.availability in ["available", "scarce"]
             ]
 
-        if min_num_qubits is not None:
-            backends = [b for b in backends if b.num_qubits >= min_num_qubits]
-
         return backends
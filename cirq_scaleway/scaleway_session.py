@@ -12,13 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import time
-import json
+import atexit
+import asyncio
+import functools
 import cirq
 import httpx
 import randomname
 
 from cirq.study import ResultDict
-from typing import Union, Optional, Dict, List
+from typing import Union, Optional, Dict, Iterator, List
 from pytimeparse.timeparse import timeparse
 
 from .scaleway_client import QaaSClient
@@ -29,11 +31,61 @@ from .scaleway_models import (
     RunPayload,
     SerializationType,
     CircuitPayload,
+    dumps_json,
+    loads_json,
 )
-from .versions import USER_AGENT
+from .versions import user_agent
+
+_DEFAULT_TIMEOUT = 60 * 10
+_DEFAULT_HTTP_TIMEOUT = 30.0
+_DEFAULT_FETCH_INTERVAL = 2
+_MAX_FETCH_INTERVAL = 30
+_FETCH_INTERVAL_BACKOFF = 1.5
+_MAX_PENDING_JOBS = 16
+
+
+@functools.lru_cache(maxsize=None)
+def _http_client() -> httpx.Client:
+    # Shared across sessions to reuse connections (and TLS sessions) between result downloads
+    http_client = httpx.Client(
+        timeout=_DEFAULT_HTTP_TIMEOUT, headers={"User-Agent": user_agent()}
+    )
+    atexit.register(http_client.close)
+
+    return http_client
+
+
+def _sleep_time(
+    fetch_interval: float, timeout: Optional[int], last_progress_time: float
+) -> float:
+    # Never sleep past the deadline: the last poll happens right on it
+    if timeout is None:
+        return fetch_interval
+
+    remaining = timeout - (time.monotonic() - last_progress_time)
+
+    return max(min(fetch_interval, remaining), 0)
+
+
+@functools.lru_cache(maxsize=None)
+def _job_payload_schema():
+    # Building a marshmallow schema is far more expensive than dumping with it
+    return JobPayload.schema()
 
 
 class ScalewaySession(cirq.work.Sampler):
+    # cirq.work.Sampler has no __slots__, so instances keep a __dict__
+    # (needed by the cached properties), but private fields live in slots
+    __slots__ = (
+        "_ScalewaySession__id",
+        "_ScalewaySession__device",
+        "_ScalewaySession__client",
+        "_ScalewaySession__name",
+        "_ScalewaySession__deduplication_id",
+        "_ScalewaySession__max_duration",
+        "_ScalewaySession__max_idle_duration",
+    )
+
     def __init__(
         self,
         device,
@@ -173,92 +225,271 @@ class ScalewaySession(cirq.work.Sampler):
             Result list for this run; one for each possible parameter resolver.
         """
         trial_results = []
+        pending_job_ids = []
 
         if not self.__id:
             raise Exception("session not started")
 
-        for param_resolver in cirq.study.to_resolvers(params):
-            circuit = cirq.protocols.resolve_parameters(program, param_resolver)
-            serialized_circuit = cirq.to_json(circuit)
-
-            run_opts = RunPayload(
-                options={"shots": repetitions},
-                circuits=[
-                    CircuitPayload(
-                        serialization_type=SerializationType.JSON,
-                        circuit_serialization=serialized_circuit,
-                    )
-                ],
+        backend_opts = self._backend_payload()
+
+        # Jobs are independent: submit them all before waiting for any result,
+        # with a bounded number of pending jobs to avoid flooding the API
+        for run_opts in self._run_payloads(program, params, repetitions):
+            pending_job_ids.append(self._submit(run_opts, backend_opts, self.__id))
+
+            if len(pending_job_ids) >= _MAX_PENDING_JOBS:
+                trial_results += self._fetch_results(pending_job_ids)
+                pending_job_ids = []
+
+        trial_results += self._fetch_results(pending_job_ids)
+
+        return trial_results
+
+    async def run_sweep_async(
+        self,
+        program: cirq.AbstractCircuit,
+        params: cirq.study.Sweepable,
+        repetitions: int = 1,
+    ) -> List[cirq.study.Result]:
+        """Asynchronously samples from the given Circuit.
+
+        Same as `run_sweep`, but job status polling is done on the running
+        event loop, so several sessions can wait for their results concurrently.
+
+        Args:
+            program: The circuit to sample from.
+            params: Parameters to run with the program.
+            repetitions: The number of times to sample.
+
+        Returns:
+            Result list for this run; one for each possible parameter resolver.
+        """
+        trial_results = []
+        pending_job_ids = []
+
+        if not self.__id:
+            raise Exception("session not started")
+
+        backend_opts = self._backend_payload()
+
+        for run_opts in self._run_payloads(program, params, repetitions):
+            pending_job_ids.append(
+                await asyncio.to_thread(self._submit, run_opts, backend_opts, self.__id)
             )
 
-            results = self._submit(run_opts, self.__id)
-            trial_results.append(results)
+            if len(pending_job_ids) >= _MAX_PENDING_JOBS:
+                trial_results += await self._fetch_results_async(pending_job_ids)
+                pending_job_ids = []
+
+        trial_results += await self._fetch_results_async(pending_job_ids)
 
         return trial_results
 
-    def _extract_payload_from_response(self, result_response: Dict) -> str:
+    def _run_payloads(
+        self,
+        program: cirq.AbstractCircuit,
+        params: cirq.study.Sweepable,
+        repetitions: int,
+    ) -> Iterator[RunPayload]:
+        run_options = {"shots": repetitions}
+        resolvers = cirq.study.to_resolvers(params)
+
+        # A parameter-free circuit is the same for every resolver
+        if not cirq.is_parameterized(program):
+            run_opts = self._run_payload(
+                cirq.to_json(program, indent=None), run_options
+            )
+
+            for _ in resolvers:
+                yield run_opts
+
+            return
+
+        previous_circuit = None
+        serialized_circuit = None
+
+        for param_resolver in resolvers:
+            circuit = cirq.protocols.resolve_parameters(program, param_resolver)
+
+            # Consecutive points resolving to the same circuit share its serialization
+            if circuit != previous_circuit:
+                serialized_circuit = cirq.to_json(circuit, indent=None)
+                previous_circuit = circuit
+
+            yield self._run_payload(serialized_circuit, run_options)
+
+    def _run_payload(self, serialized_circuit: str, run_options: Dict) -> RunPayload:
+        return RunPayload(
+            options=run_options,
+            circuits=[
+                CircuitPayload(
+                    serialization_type=SerializationType.JSON,
+                    circuit_serialization=serialized_circuit,
+                )
+            ],
+        )
+
+    def _extract_payload_from_response(
+        self, result_response: Dict
+    ) -> Union[str, bytes]:
         result = result_response.get("result", None)
 
         if result is None or result == "":
             url = result_response.get("url", None)
 
             if url is not None:
-                resp = httpx.get(url)
+                resp = _http_client().get(url)
                 resp.raise_for_status()
 
-                return resp.text
+                # Raw bytes are handed to the JSON parser, skipping a str decode
+                return resp.content
             else:
                 raise Exception("Got result with both empty data and url fields")
         else:
             return result
 
-    def _wait_for_result(
-        self, job_id: str, timeout: Optional[int] = None, fetch_interval: int = 2
-    ) -> Dict | None:
-        start_time = time.time()
+    def _poll_job(self, job_id: str) -> List | None:
+        job = self.__client.get_job(job_id)
+
+        if job["status"] == "completed":
+            return self.__client.get_job_results(job_id)
+
+        if job["status"] in ["error", "unknown_status"]:
+            raise Exception("Job error")
+
+        return None
+
+    def _wait_for_results(
+        self,
+        job_ids: List[str],
+        timeout: Optional[int] = None,
+        fetch_interval: Optional[float] = None,
+    ) -> List[List]:
+        # A single backoff clock for the whole window: jobs that are already
+        # done when it ticks cost no extra sleep. The timeout counts time
+        # without any job completing, so a backend running the window's jobs
+        # one after another gives each of them the full timeout.
+        if fetch_interval is None:
+            fetch_interval = _DEFAULT_FETCH_INTERVAL
+
+        last_progress_time = time.monotonic()
+        job_results = {}
 
         while True:
-            time.sleep(fetch_interval)
+            time.sleep(_sleep_time(fetch_interval, timeout, last_progress_time))
+            fetch_interval = min(
+                fetch_interval * _FETCH_INTERVAL_BACKOFF, _MAX_FETCH_INTERVAL
+            )
+
+            for job_id in job_ids:
+                if job_id not in job_results:
+                    results = self._poll_job(job_id)
+
+                    if results is not None:
+                        job_results[job_id] = results
+                        last_progress_time = time.monotonic()
 
-            elapsed = time.time() - start_time
+            if len(job_results) == len(job_ids):
+                return [job_results[job_id] for job_id in job_ids]
+
+            elapsed = time.monotonic() - last_progress_time
 
             if timeout is not None and elapsed >= timeout:
                 raise Exception("Timed out waiting for result")
 
-            job = self.__client.get_job(job_id)
+    async def _wait_for_results_async(
+        self,
+        job_ids: List[str],
+        timeout: Optional[int] = None,
+        fetch_interval: Optional[float] = None,
+    ) -> List[List]:
+        if fetch_interval is None:
+            fetch_interval = _DEFAULT_FETCH_INTERVAL
 
-            if job["status"] == "completed":
-                return self.__client.get_job_results(job_id)
+        last_progress_time = time.monotonic()
+        job_results = {}
 
-            if job["status"] in ["error", "unknown_status"]:
-                raise Exception("Job error")
+        while True:
+            await asyncio.sleep(
+                _sleep_time(fetch_interval, timeout, last_progress_time)
+            )
+            fetch_interval = min(
+                fetch_interval * _FETCH_INTERVAL_BACKOFF, _MAX_FETCH_INTERVAL
+            )
+
+            pending_job_ids = [j for j in job_ids if j not in job_results]
+
+            # Blocking HTTP calls run in worker threads to keep the loop free
+            polled_results = await asyncio.gather(
+                *[asyncio.to_thread(self._poll_job, j) for j in pending_job_ids]
+            )
+
+            for job_id, results in zip(pending_job_ids, polled_results):
+                if results is not None:
+                    job_results[job_id] = results
+                    last_progress_time = time.monotonic()
+
+            if len(job_results) == len(job_ids):
+                return [job_results[job_id] for job_id in job_ids]
+
+            elapsed = time.monotonic() - last_progress_time
+
+            if timeout is not None and elapsed >= timeout:
+                raise Exception("Timed out waiting for result")
 
     def _to_cirq_result(self, job_results: List) -> cirq.Result:
         if len(job_results) == 0:
             raise Exception("Empty result list")
 
         payload = self._extract_payload_from_response(job_results[0])
-        payload_dict = json.loads(payload)
+        payload_dict = loads_json(payload)
         cirq_result = ResultDict._from_json_dict_(**payload_dict)
 
         return cirq_result
 
-    def _submit(self, run_opts: RunPayload, session_id: str) -> cirq.study.Result:
-        backend_opts = BackendPayload(
+    def _backend_payload(self) -> BackendPayload:
+        # Built per sweep, not per session: the device may have been refreshed
+        return BackendPayload(
             name=self.__device.name, version=self.__device.version, options={}
         )
 
-        client_opts = ClientPayload(user_agent=USER_AGENT)
-
-        job_payload = JobPayload.schema().dumps(
-            JobPayload(backend=backend_opts, run=run_opts, client=client_opts)
+    @functools.cached_property
+    def _client_payload(self) -> ClientPayload:
+        return ClientPayload(user_agent=user_agent())
+
+    def _submit(
+        self, run_opts: RunPayload, backend_opts: BackendPayload, session_id: str
+    ) -> str:
+        job_payload = dumps_json(
+            _job_payload_schema().dump(
+                JobPayload(
+                    backend=backend_opts,
+                    run=run_opts,
+                    client=self._client_payload,
+                )
+            )
         )
 
         job_id = self.__client.create_job(
             name=randomname.get_name(), session_id=session_id, circuits=job_payload
         )
 
-        job_results = self._wait_for_result(job_id, 60 * 10, 2)
-        result = self._to_cirq_result(job_results)
+        return job_id
+
+    def _fetch_results(self, job_ids: List[str]) -> List[cirq.study.Result]:
+        if not job_ids:
+            return []
 
-        return result
+        job_results = self._wait_for_results(job_ids, _DEFAULT_TIMEOUT)
+
+        return [self._to_cirq_result(results) for results in job_results]
+
+    async def _fetch_results_async(self, job_ids: List[str]) -> List[cirq.study.Result]:
+        if not job_ids:
+            return []
+
+        job_results = await self._wait_for_results_async(job_ids, _DEFAULT_TIMEOUT)
+
+        return await asyncio.gather(
+            *[asyncio.to_thread(self._to_cirq_result, r) for r in job_results]
+        )
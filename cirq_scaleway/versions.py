@@ -11,20 +11,44 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import functools
 import importlib.metadata
 import platform
 
-from typing import Final
 
-CIRQ_VERSION: Final = importlib.metadata.version("cirq-core")
-CIRQ_SCALEWAY_PROVIDER_VERSION: Final = importlib.metadata.version("cirq-scaleway")
+@functools.lru_cache(maxsize=None)
+def cirq_version() -> str:
+    # Metadata lookups scan sys.path, so they only run on first call
+    return importlib.metadata.version("cirq-core")
 
-__version__: Final = CIRQ_SCALEWAY_PROVIDER_VERSION
 
-USER_AGENT: Final = " ".join(
-    [
-        f"cirq-scaleway/{CIRQ_SCALEWAY_PROVIDER_VERSION}",
-        f"({platform.system()}; {platform.python_implementation()}/{platform.python_version()})",
-        f"cirq-core/{CIRQ_VERSION}",
-    ]
-)
+@functools.lru_cache(maxsize=None)
+def cirq_scaleway_provider_version() -> str:
+    # Metadata lookups scan sys.path, so they only run on first call
+    return importlib.metadata.version("cirq-scaleway")
+
+
+@functools.lru_cache(maxsize=None)
+def user_agent() -> str:
+    return " ".join(
+        [
+            f"cirq-scaleway/{cirq_scaleway_provider_version()}",
+            f"({platform.system()}; {platform.python_implementation()}/{platform.python_version()})",
+            f"cirq-core/{cirq_version()}",
+        ]
+    )
+
+
+_LAZY_ATTRIBUTES = {
+    "CIRQ_VERSION": cirq_version,
+    "CIRQ_SCALEWAY_PROVIDER_VERSION": cirq_scaleway_provider_version,
+    "__version__": cirq_scaleway_provider_version,
+    "USER_AGENT": user_agent,
+}
+
+
+def __getattr__(name: str) -> str:
+    if name in _LAZY_ATTRIBUTES:
+        return _LAZY_ATTRIBUTES[name]()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
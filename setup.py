@@ -33,6 +33,7 @@ setup(
     author_email="community@scaleway.com",
     python_requires=(">=3.10.0"),
     install_requires=requirements,
+    extras_require={"orjson": ["orjson"]},
     license="Apache 2",
     description=description,
     long_description=long_description,
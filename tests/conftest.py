@@ -0,0 +1,144 @@
+import gzip
+import json
+import time
+import functools
+
+import cirq
+import httpx
+import numpy as np
+import pytest
+
+from cirq_scaleway import scaleway_session
+from cirq_scaleway.scaleway_client import QaaSClient
+
+API_URL = "http://qaas.test"
+
+
+class FakeQaaSApi:
+    """In-memory QaaS API, served to the real QaaSClient through httpx.MockTransport."""
+
+    def __init__(self):
+        self.platforms = {
+            "p1": {
+                "id": "p1",
+                "name": "qsim_simulation_small",
+                "version": "1.0",
+                "backend_name": "qsim",
+                "max_qubit_count": 20,
+                "availability": "available",
+            },
+            "p2": {
+                "id": "p2",
+                "name": "qsim_simulation_large",
+                "version": "1.0",
+                "backend_name": "qsim",
+                "max_qubit_count": 40,
+                "availability": "shortage",
+            },
+        }
+        # Status returned by every job once its pending polls are consumed
+        self.final_job_status = "completed"
+        self.pending_polls = 0
+        # Status answered to gzip bodies on job creation, None to accept them
+        self.gzip_status_code = None
+        # When set, jobs run one after another, each taking this many seconds
+        self.job_duration = None
+        self.last_job_end = 0
+        self.jobs = {}
+        self.requests = []
+
+    def count(self, method: str, path: str) -> int:
+        return sum(
+            1 for r in self.requests if r.method == method and r.url.path == path
+        )
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        parts = request.url.path.strip("/").split("/")
+
+        if parts[0] == "platforms":
+            if len(parts) == 2:
+                return httpx.Response(200, json=self.platforms[parts[1]])
+
+            return httpx.Response(
+                200, json={"platforms": list(self.platforms.values())}
+            )
+
+        if parts[0] == "sessions":
+            return httpx.Response(200, json={"id": "s1"})
+
+        if parts[0] == "jobs" and request.method == "POST":
+            content = request.content
+            if request.headers.get("Content-Encoding") == "gzip":
+                if self.gzip_status_code is not None:
+                    return httpx.Response(self.gzip_status_code)
+
+                content = gzip.decompress(content)
+
+            job_id = f"j{len(self.jobs)}"
+            self.jobs[job_id] = {
+                "index": len(self.jobs),
+                "payload": json.loads(content),
+                "polls": 0,
+            }
+
+            if self.job_duration is not None:
+                start = max(time.monotonic(), self.last_job_end)
+                self.last_job_end = start + self.job_duration
+                self.jobs[job_id]["end"] = self.last_job_end
+
+            return httpx.Response(200, json={"id": job_id})
+
+        job = self.jobs[parts[1]]
+
+        if len(parts) == 3:
+            # Each result measures the job submission index, to check ordering
+            result = cirq.ResultDict(
+                params=cirq.ParamResolver({}),
+                measurements={"m": np.array([[job["index"]]])},
+            )
+
+            return httpx.Response(
+                200, json={"job_results": [{"result": cirq.to_json(result)}]}
+            )
+
+        job["polls"] += 1
+        running = job["polls"] <= self.pending_polls or time.monotonic() < job.get(
+            "end", 0
+        )
+        status = "running" if running else self.final_job_status
+
+        return httpx.Response(200, json={"id": parts[1], "status": status})
+
+
+@pytest.fixture
+def api(monkeypatch):
+    fake_api = FakeQaaSApi()
+    transport = httpx.MockTransport(fake_api.handler)
+
+    monkeypatch.setattr(
+        httpx, "Client", functools.partial(httpx.Client, transport=transport)
+    )
+    monkeypatch.setattr(scaleway_session, "_DEFAULT_FETCH_INTERVAL", 0.001)
+    scaleway_session._http_client.cache_clear()
+
+    yield fake_api
+
+    scaleway_session._http_client.cache_clear()
+
+
+@pytest.fixture
+def api_url():
+    return API_URL
+
+
+@pytest.fixture
+def client(api):
+    return QaaSClient(project_id="project", token="token", url=API_URL)
+
+
+@pytest.fixture
+def gzip_client(api):
+    return QaaSClient(
+        project_id="project", token="token", url=API_URL, compress_requests=True
+    )
@@ -0,0 +1,49 @@
+from cirq_scaleway.scaleway_client import _COMPRESSION_THRESHOLD
+
+
+def _post_jobs(api, client, count, status_code):
+    api.gzip_status_code = status_code
+
+    return [
+        client._post_json("/jobs", {"circuit": "x" * _COMPRESSION_THRESHOLD})
+        for _ in range(count)
+    ]
+
+
+def test_compression_is_disabled_by_default(api, client):
+    responses = _post_jobs(api, client, 2, 400)
+
+    assert [r.status_code for r in responses] == [200, 200]
+    assert [r.headers.get("Content-Encoding") for r in api.requests] == [None, None]
+
+
+def test_gzip_rejection_disables_compression(api, gzip_client):
+    responses = _post_jobs(api, gzip_client, 2, 415)
+
+    assert [r.status_code for r in responses] == [200, 200]
+    assert [r.headers.get("Content-Encoding") for r in api.requests] == [
+        "gzip",
+        None,
+        None,
+    ]
+    assert [r.request.headers.get("Content-Encoding") for r in responses] == [
+        None,
+        None,
+    ]
+
+
+def test_bad_request_is_not_retried(api, gzip_client):
+    responses = _post_jobs(api, gzip_client, 2, 400)
+
+    assert [r.status_code for r in responses] == [400, 400]
+    assert [r.headers.get("Content-Encoding") for r in api.requests] == [
+        "gzip",
+        "gzip",
+    ]
+
+
+def test_small_payload_is_not_compressed(api, gzip_client):
+    response = gzip_client._post_json("/jobs", {"circuit": "x"})
+
+    assert response.status_code == 200
+    assert api.requests[0].headers.get("Content-Encoding") is None
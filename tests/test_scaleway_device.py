@@ -0,0 +1,73 @@
+import pickle
+
+import pytest
+
+from cirq_scaleway import ScalewayDevice, scaleway_device
+
+
+def test_pickle_device_from_used_client(api, client):
+    platform = client.list_platforms()["platforms"][0]
+    device = ScalewayDevice._from_platform(client, platform)
+
+    unpickled = pickle.loads(pickle.dumps(device))
+
+    assert repr(unpickled) == repr(device)
+    assert unpickled.refresh_availability() == "available"
+    assert api.count("GET", "/platforms/p1") == 1
+
+
+def _device(client):
+    return ScalewayDevice(
+        client=client,
+        id="p1",
+        name="qsim_simulation_small",
+        version="1.0",
+        num_qubits=20,
+        metadata=None,
+    )
+
+
+def test_availability_is_cached_within_ttl(api, client):
+    device = _device(client)
+
+    assert device.availability == "available"
+    assert device.availability == "available"
+    assert api.count("GET", "/platforms/p1") == 1
+
+
+def test_availability_expires_after_ttl(api, client, monkeypatch):
+    monkeypatch.setattr(scaleway_device, "_AVAILABILITY_TTL", 0)
+    device = _device(client)
+
+    device.availability
+    device.availability
+
+    assert api.count("GET", "/platforms/p1") == 2
+
+
+def test_refresh_availability_forces_request(api, client):
+    device = _device(client)
+    device.availability
+
+    api.platforms["p1"]["availability"] = "scarce"
+
+    assert device.refresh_availability() == "scarce"
+    assert device.availability == "scarce"
+    assert api.count("GET", "/platforms/p1") == 2
+
+
+def test_static_fields_are_read_only(api, client):
+    device = _device(client)
+
+    with pytest.raises(AttributeError):
+        device.name = "other"
+
+    assert device.name == "qsim_simulation_small"
+
+
+def test_refresh_updates_static_fields(api, client):
+    device = _device(client)
+    api.platforms["p1"]["max_qubit_count"] = 24
+
+    assert device._refresh().num_qubits == 24
+    assert "num_qubits=24" in repr(device)
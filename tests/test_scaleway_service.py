@@ -0,0 +1,15 @@
+from cirq_scaleway import ScalewayQuantumService
+
+
+def test_devices_filters_without_availability_requests(api, api_url):
+    service = ScalewayQuantumService(
+        project_id="project", secret_key="token", url=api_url
+    )
+
+    devices = service.devices(operational=True, min_num_qubits=10)
+
+    assert [d.id for d in devices] == ["p1"]
+    assert api.count("GET", "/platforms") == 1
+    assert api.count("GET", "/platforms/p1") == 0
+    assert api.count("GET", "/platforms/p2") == 0
+    assert api.requests[0].url.params["backend_name"] == "qsim"
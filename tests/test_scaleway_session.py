@@ -0,0 +1,161 @@
+import json
+import time
+import pickle
+import asyncio
+
+import cirq
+import pytest
+import sympy
+
+from cirq_scaleway import ScalewayDevice, ScalewaySession, scaleway_session
+
+T = sympy.Symbol("t")
+
+
+def _device(client):
+    platform = client.list_platforms()["platforms"][0]
+
+    return ScalewayDevice._from_platform(client, platform)
+
+
+def _circuit():
+    q = cirq.LineQubit(0)
+
+    return cirq.Circuit(cirq.X(q) ** T, cirq.measure(q, key="m"))
+
+
+def _sweep(count):
+    return cirq.Linspace(T, 0, 1, count)
+
+
+def test_pickle_started_session(api, client):
+    session = _device(client).create_session().start()
+
+    unpickled = pickle.loads(pickle.dumps(session))
+
+    assert unpickled.id == session.id
+    assert unpickled.name == session.name
+    unpickled.stop()
+    assert api.count("POST", "/sessions/s1/terminate") == 1
+
+
+def test_run_payloads_reuses_serialization_of_repeated_points():
+    q = cirq.LineQubit(0)
+    t, u = sympy.Symbol("t"), sympy.Symbol("u")
+    circuit = cirq.Circuit(cirq.X(q) ** t, cirq.measure(q, key="m"))
+    session = ScalewaySession.__new__(ScalewaySession)
+
+    payloads = list(
+        session._run_payloads(
+            circuit, cirq.Points(t, [0.25, 0.5]) * cirq.Linspace(u, 0, 1, 3), 1
+        )
+    )
+    serializations = [p.circuits[0].circuit_serialization for p in payloads]
+
+    assert len(payloads) == 6
+    assert serializations[0] is serializations[2]
+    assert serializations[3] is serializations[5]
+    assert serializations[0] != serializations[3]
+
+
+def test_run_sweep_sleeps_once_for_finished_window(api, client, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(scaleway_session.time, "sleep", sleeps.append)
+
+    with _device(client).create_session() as session:
+        results = session.run_sweep(_circuit(), _sweep(8), repetitions=1)
+
+    assert len(results) == 8
+    assert len(sleeps) == 1
+    assert api.count("GET", "/jobs/j7") == 1
+
+
+def _run_sweep(session, count, run_async):
+    if run_async:
+        return asyncio.run(session.run_sweep_async(_circuit(), _sweep(count)))
+
+    return session.run_sweep(_circuit(), _sweep(count))
+
+
+@pytest.mark.parametrize("run_async", [False, True])
+def test_run_sweep_keeps_order_across_windows(api, client, run_async):
+    api.pending_polls = 2
+    count = scaleway_session._MAX_PENDING_JOBS + 4
+
+    with _device(client).create_session() as session:
+        results = _run_sweep(session, count, run_async)
+
+    assert [r.measurements["m"][0][0] for r in results] == list(range(count))
+
+    for index, resolver in enumerate(cirq.to_resolvers(_sweep(count))):
+        job = json.loads(api.jobs[f"j{index}"]["payload"]["circuit"]["qiskit_circuit"])
+        circuit = cirq.read_json(
+            json_text=job["run"]["circuits"][0]["circuit_serialization"]
+        )
+        assert circuit == cirq.resolve_parameters(_circuit(), resolver)
+
+
+@pytest.mark.parametrize("run_async", [False, True])
+def test_run_sweep_times_out(api, client, monkeypatch, run_async):
+    api.pending_polls = 10**6
+    monkeypatch.setattr(scaleway_session, "_DEFAULT_TIMEOUT", 0.05)
+
+    with _device(client).create_session() as session:
+        with pytest.raises(Exception, match="Timed out waiting for result"):
+            _run_sweep(session, 2, run_async)
+
+
+@pytest.mark.parametrize("run_async", [False, True])
+def test_run_sweep_timeout_applies_per_job(api, client, monkeypatch, run_async):
+    # Jobs run one after another: the whole window takes longer than the
+    # timeout, but each job completes well within it
+    api.job_duration = 0.05
+    monkeypatch.setattr(scaleway_session, "_MAX_FETCH_INTERVAL", 0.01)
+    monkeypatch.setattr(scaleway_session, "_DEFAULT_TIMEOUT", 0.15)
+
+    with _device(client).create_session() as session:
+        results = _run_sweep(session, 6, run_async)
+
+    assert [r.measurements["m"][0][0] for r in results] == list(range(6))
+
+
+@pytest.mark.parametrize("run_async", [False, True])
+def test_run_sweep_raises_on_job_error(api, client, run_async):
+    api.final_job_status = "error"
+
+    with _device(client).create_session() as session:
+        with pytest.raises(Exception, match="Job error"):
+            _run_sweep(session, 2, run_async)
+
+    assert api.count("GET", "/jobs/j0/results") == 0
+
+
+@pytest.mark.parametrize("run_async", [False, True])
+def test_run_sweep_does_not_sleep_past_timeout(api, client, monkeypatch, run_async):
+    api.pending_polls = 10**6
+    monkeypatch.setattr(scaleway_session, "_DEFAULT_FETCH_INTERVAL", 30)
+    monkeypatch.setattr(scaleway_session, "_DEFAULT_TIMEOUT", 0.05)
+    start_time = time.monotonic()
+
+    with _device(client).create_session() as session:
+        with pytest.raises(Exception, match="Timed out waiting for result"):
+            _run_sweep(session, 2, run_async)
+
+    assert time.monotonic() - start_time < 5
+
+
+def test_run_sweep_submits_refreshed_device_version(api, client):
+    device = _device(client)
+
+    with device.create_session() as session:
+        session.run_sweep(_circuit(), _sweep(1))
+        api.platforms["p1"]["version"] = "2.0"
+        device._refresh()
+        session.run_sweep(_circuit(), _sweep(1))
+
+    versions = [
+        json.loads(job["payload"]["circuit"]["qiskit_circuit"])["backend"]["version"]
+        for job in api.jobs.values()
+    ]
+
+    assert versions == ["1.0", "2.0"]